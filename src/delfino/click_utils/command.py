@@ -181,6 +181,9 @@ class CommandRegistry(Mapping):
         """
         # We want to keep loaded _CommandPackage instance in the same order as defined in the config
         command_packages: Dict[str, Optional[_CommandPackage]] = {plugin_name: None for plugin_name in plugins_configs}
+        if not command_packages.keys() - {cls.LOCAL_PLUGIN_NAME}:
+            return []  # No plugins to look for, no need to go through metadata of all installed distributions
+
         for distribution in distributions():
             for entry_point in distribution.entry_points.select(group=cls.TYPE_OF_PLUGIN):
                 if not entry_point:
@@ -34,7 +34,9 @@ def pass_app_context(
                 raise RuntimeError(
                     f"Managed to invoke callback without a context object of type {AppContext.__name__!r} existing."
                 )
-            obj.plugin_config = plugin_config_type(**obj.plugin_config.dict())
+            # Group commands forward to sub-commands sharing the same ``AppContext``. Parse the config only once.
+            if not isinstance(obj.plugin_config, plugin_config_type):
+                obj.plugin_config = plugin_config_type(**obj.plugin_config.dict())
             return ctx.invoke(func, *args, **kwargs, **{kwargs_name: obj})
 
         return functools.update_wrapper(cast(_Func, new_func), func)
@@ -62,7 +62,10 @@ def _install_completion(
     formatted_completion: str, *, completion_path: Path, completion_init_lines: List[str], rc_path: Path
 ) -> Path:
     rc_path.parent.mkdir(parents=True, exist_ok=True)
-    rc_content = rc_path.read_text(encoding="utf-8") if rc_path.is_file() else ""
+    try:
+        rc_content = rc_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        rc_content = ""
 
     content_added = False
     for line in completion_init_lines:
@@ -74,11 +77,11 @@ def _install_completion(
         raise CompletionAlreadyInstalled()
 
     rc_content += "\n"
-    rc_path.write_text(rc_content)
+    rc_path.write_text(rc_content, encoding="utf-8")
 
     # Install completion
     completion_path.parent.mkdir(parents=True, exist_ok=True)
-    completion_path.write_text(formatted_completion)
+    completion_path.write_text(formatted_completion, encoding="utf-8")
     return completion_path
 
 
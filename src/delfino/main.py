@@ -39,6 +39,8 @@ class Commands(click.MultiCommand):
         except FileNotFoundError:
             self._pyproject_toml = PyprojectToml()
 
+        self._package_manager = get_package_manager(self._project_root, self._pyproject_toml)
+
         self._command_registry = CommandRegistry(
             plugins_configs=self._pyproject_toml.tool.delfino.plugins,
             local_commands_directory=self._pyproject_toml.tool.delfino.local_commands_directory,
@@ -67,7 +69,7 @@ class Commands(click.MultiCommand):
         ctx.obj = AppContext(
             project_root=self._project_root,
             pyproject_toml=self._pyproject_toml,
-            package_manager=get_package_manager(self._project_root, self._pyproject_toml),
+            package_manager=self._package_manager,
             plugin_config=cmd.package.plugin_config,
         )
 
@@ -16,7 +16,10 @@ def pyproject_toml_key_missing(key: str) -> str:
 
 def pip_package_installed(name: str, sub_process: bool = False) -> bool:
     if sub_process:
-        return run(f"pip show -q {name}", stdout=PIPE, stderr=PIPE, on_error=OnError.PASS, shell=True).returncode == 0
+        try:
+            return run(["pip", "show", "-q", name], stdout=PIPE, stderr=PIPE, on_error=OnError.PASS).returncode == 0
+        except FileNotFoundError:  # `pip` itself is not available
+            return False
 
     try:
         metadata.Distribution.from_name(name)
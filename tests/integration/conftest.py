@@ -2,6 +2,7 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from _pytest.assertion import register_assert_rewrite
@@ -12,11 +13,16 @@ FAKE_PLUGINS_DIR = PROJECT_ROOT / "tests/integration/fake_plugins"
 
 register_assert_rewrite(".assertions")
 
+_POETRY_PLUGINS = [
+    "fake_plugin_b",
+    "fake_plugin_without_entry_point",
+    "fake_plugin_with_different_entry_point",
+]
+
 
 def _build_and_install_setuptools_plugin(tmpdir, plugin_name: str):
     plugin_dir = FAKE_PLUGINS_DIR / plugin_name
-    cmd = f"cd {plugin_dir} && pip install . -q --target {tmpdir}"
-    subprocess.run(cmd, shell=True, check=True)
+    subprocess.run(["pip", "install", ".", "-q", "--target", tmpdir], cwd=plugin_dir, check=True)
     shutil.rmtree(plugin_dir / "build")
     shutil.rmtree(plugin_dir / f"{plugin_dir.stem}.egg-info")
 
@@ -24,8 +30,8 @@ def _build_and_install_setuptools_plugin(tmpdir, plugin_name: str):
 def _build_and_install_poetry_plugin(tmpdir, plugin_name: str):
     plugin_dir = FAKE_PLUGINS_DIR / plugin_name
     wheel_path = plugin_dir / "dist" / f"{plugin_name}-0.0.1-py2.py3-none-any.whl"
-    subprocess.run(f"cd {plugin_dir} && poetry build -q", shell=True, check=True)
-    subprocess.run(f"pip install {wheel_path} -q --target {tmpdir}", shell=True, check=True)
+    subprocess.run(["poetry", "build", "-q"], cwd=plugin_dir, check=True)
+    subprocess.run(["pip", "install", wheel_path, "-q", "--target", tmpdir], check=True)
     shutil.rmtree(plugin_dir / "dist")
 
 
@@ -34,13 +40,17 @@ def install_fake_plugins():
     with tempfile.TemporaryDirectory() as tmpdir:
         sys.path.append(tmpdir)
         try:
-            _build_and_install_setuptools_plugin(tmpdir, "fake_plugin_a")
-            for plugin_name in [
-                "fake_plugin_b",
-                "fake_plugin_without_entry_point",
-                "fake_plugin_with_different_entry_point",
-            ]:
-                _build_and_install_poetry_plugin(tmpdir, plugin_name)
+            # Each plugin is built in its own folder, so the builds are independent and can run concurrently
+            with ThreadPoolExecutor(max_workers=len(_POETRY_PLUGINS) + 1) as executor:
+                futures = [
+                    executor.submit(_build_and_install_setuptools_plugin, tmpdir, "fake_plugin_a"),
+                    *(
+                        executor.submit(_build_and_install_poetry_plugin, tmpdir, plugin_name)
+                        for plugin_name in _POETRY_PLUGINS
+                    ),
+                ]
+                for future in futures:
+                    future.result()  # re-raise any build failure
             yield
         finally:
             sys.path.remove(tmpdir)
@@ -37,7 +37,7 @@ def demo_commands(
         root_dir.mkdir(exist_ok=True)
         (root_dir / "__init__.py").touch()
         for fake_command_file in fake_command_files:
-            (root_dir / fake_command_file.filename).write_text(fake_command_file.content)
+            (root_dir / fake_command_file.filename).write_text(fake_command_file.content, encoding="utf-8")
         sys.path.append(tmpdir)
         try:
             yield [fake_command_file.command_name for fake_command_file in fake_command_files]
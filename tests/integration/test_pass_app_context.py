@@ -0,0 +1,41 @@
+import click
+
+from delfino.decorators import pass_app_context
+from delfino.models.pyproject_toml import PluginConfig
+
+
+class _PluginConfig(PluginConfig):
+    option: str = "default"
+
+
+@click.command()
+@pass_app_context(_PluginConfig)
+def _command(app_context):
+    print(app_context.plugin_config.option)
+
+
+@click.group(invoke_without_command=True)
+@click.pass_context
+@pass_app_context(_PluginConfig)
+def _group(click_context, app_context):
+    print(id(app_context.plugin_config))
+    click_context.forward(_command)
+    print(id(app_context.plugin_config))
+
+
+class TestPassAppContextDecorator:
+    @staticmethod
+    def should_parse_plugin_config(runner, context_obj):
+        context_obj.plugin_config = PluginConfig(option="from config")
+        result = runner.invoke(_command, obj=context_obj)
+        assert result.exit_code == 0, result.output
+        assert result.stdout.rstrip() == "from config"
+        assert isinstance(context_obj.plugin_config, _PluginConfig)
+
+    @staticmethod
+    def should_not_parse_plugin_config_again_in_forwarded_commands(runner, context_obj):
+        result = runner.invoke(_group, obj=context_obj)
+        assert result.exit_code == 0, result.output
+        id_before, option, id_after = result.stdout.split()
+        assert option == "default"
+        assert id_before == id_after
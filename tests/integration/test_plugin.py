@@ -2,7 +2,9 @@ from types import ModuleType
 
 import pytest
 
+from delfino.click_utils import command
 from delfino.click_utils.command import CommandRegistry
+from delfino.models.pyproject_toml import PluginConfig
 from tests.integration.fixtures import ALL_PLUGINS_ALL_COMMANDS
 
 
@@ -21,3 +23,17 @@ class TestPlugin:
         assert isinstance(fake_plugin_a_package.package, ModuleType)
         assert isinstance(fake_plugin_a_package.package.__package__, str)
         assert "fake_plugin_a.commands" in fake_plugin_a_package.package.__package__
+
+
+class TestPluginDiscovery:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "plugins_configs",
+        [
+            pytest.param({}, id="no plugins"),
+            pytest.param({CommandRegistry.LOCAL_PLUGIN_NAME: PluginConfig.empty()}, id="local plugin only"),
+        ],
+    )
+    def should_not_scan_distributions_when_no_plugins_configured(monkeypatch, plugins_configs):
+        monkeypatch.setattr(command, "distributions", lambda: pytest.fail("Distributions should not be scanned."))
+        assert not CommandRegistry._discover_command_packages(plugins_configs)
@@ -0,0 +1,41 @@
+import pytest
+
+from delfino.internal_parameters.completion import CompletionAlreadyInstalled, _install_completion
+
+_INIT_LINES = ["source ~/.completion.sh", "fpath+=~/.zfunc"]
+
+
+class TestInstallCompletion:
+    @staticmethod
+    def should_create_new_rc_file(tmp_path):
+        rc_path = tmp_path / "home" / ".zshrc"
+        completion_path = tmp_path / "home" / ".zfunc" / "_delfino"
+
+        path = _install_completion(
+            "completion ✔", completion_path=completion_path, completion_init_lines=_INIT_LINES, rc_path=rc_path
+        )
+
+        assert path == completion_path
+        assert completion_path.read_text(encoding="utf-8") == "completion ✔"
+        assert rc_path.read_text(encoding="utf-8") == "\nsource ~/.completion.sh\nfpath+=~/.zfunc\n"
+
+    @staticmethod
+    def should_append_to_existing_rc_file(tmp_path):
+        rc_path = tmp_path / ".zshrc"
+        rc_path.write_text("# existing ✔\nfpath+=~/.zfunc", encoding="utf-8")
+
+        _install_completion(
+            "completion", completion_path=tmp_path / "_delfino", completion_init_lines=_INIT_LINES, rc_path=rc_path
+        )
+
+        assert rc_path.read_text(encoding="utf-8") == "# existing ✔\nfpath+=~/.zfunc\nsource ~/.completion.sh\n"
+
+    @staticmethod
+    def should_not_install_again(tmp_path):
+        rc_path = tmp_path / ".zshrc"
+        rc_path.write_text("\n".join(_INIT_LINES), encoding="utf-8")
+
+        with pytest.raises(CompletionAlreadyInstalled):
+            _install_completion(
+                "completion", completion_path=tmp_path / "_delfino", completion_init_lines=_INIT_LINES, rc_path=rc_path
+            )
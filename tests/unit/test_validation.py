@@ -0,0 +1,12 @@
+from delfino.validation import pip_package_installed
+
+
+class TestPipPackageInstalled:
+    @staticmethod
+    def should_return_false_when_package_is_missing_in_sub_process():
+        assert not pip_package_installed("delfino-non-existent-package", sub_process=True)
+
+    @staticmethod
+    def should_return_false_when_pip_is_missing_in_sub_process(monkeypatch, tmp_path):
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert not pip_package_installed("click", sub_process=True)